@@ -12,6 +12,11 @@ setup(
     version='0.0.1',
     author='Dorjee Gyaltsen',
     packages=find_packages(exclude=['tests']),
+    # NumPy powers the vectorized fast paths and the 2-bit DNA packing
+    # helpers in utils.bio; everything else works without it.
+    extras_require={
+        'numpy': ['numpy'],
+    },
     package_data={
         'utils': ['utils/common.py', 'utils/bio.py', 'tm.py', 'restriction_enzymes.txt']
     },
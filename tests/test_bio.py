@@ -1,4 +1,16 @@
-from utils.bio import unambiguous_dna_letters, fasta_to_dictionary, restriction_enzymes
+from utils.bio import (
+    unambiguous_dna_letters,
+    fasta_to_dictionary,
+    fasta_to_dictionary_parallel,
+    fasta_index,
+    restriction_enzymes,
+    pack_dna,
+    unpack_dna,
+    complement_packed,
+    reverse_complement_packed,
+    complement,
+    reverse_complement,
+)
 from utils.tm import Tm_staluc
 
 
@@ -21,6 +33,67 @@ def test_fasta_to_dictionary():
         assert isinstance(result, Mapping) == True
 
 
+def test_fasta_to_dictionary_parallel():
+    import os
+    from pathlib import Path
+
+    input_file = os.path.join(
+        Path(os.path.abspath(__file__)).parent, "io/two_sequences.fa"
+    )
+    expected = fasta_to_dictionary(input_file)
+    assert fasta_to_dictionary_parallel(input_file, workers=1) == expected
+    assert fasta_to_dictionary_parallel(input_file, workers=4) == expected
+
+    # NOTE: many records across few workers exercises the chunk
+    # boundary alignment; no record may be dropped or duplicated.
+    many_records = os.path.join(
+        Path(os.path.abspath(__file__)).parent, "io/many_records.fa"
+    )
+    expected = fasta_to_dictionary(many_records)
+    assert len(expected) == 50
+    assert fasta_to_dictionary_parallel(many_records, workers=3) == expected
+
+
+def test_fasta_index():
+    import os
+    from pathlib import Path
+
+    input_file = os.path.join(
+        Path(os.path.abspath(__file__)).parent, "io/two_sequences.fa"
+    )
+    expected = fasta_to_dictionary(input_file)
+    with fasta_index(input_file) as index:
+        assert len(index) == len(expected)
+        assert index.ids() == [record["id"] for record in expected]
+        for i, record in enumerate(expected):
+            assert index.get_sequence(i) == record["sequence"]
+
+
+def test_pack_dna_roundtrip():
+    import pytest
+
+    pytest.importorskip("numpy")
+
+    # NOTE: lengths straddling the 4-bases-per-byte padding boundary
+    for sequence in ["", "A", "ACG", "ACGT", "ACGTACG", "TTTTGGGCCA"]:
+        packed = pack_dna(sequence)
+        assert unpack_dna(packed, len(sequence)) == sequence
+        assert unpack_dna(complement_packed(packed), len(sequence)) == complement(
+            sequence
+        )
+        assert (
+            unpack_dna(
+                reverse_complement_packed(packed, len(sequence)), len(sequence)
+            )
+            == reverse_complement(sequence)
+        )
+
+    assert len(pack_dna("ACGTACGT")) == 2
+
+    with pytest.raises(ValueError):
+        pack_dna("ACGN")
+
+
 def test_calculate_melting_temperature():
     sequence = "CAGTCAGTACGTACGTGTACTGCCGTA"
     result = Tm_staluc(sequence)
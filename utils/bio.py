@@ -1,216 +1,534 @@
-"""Commonly used Bio related functions. 
-
-"""
-
-from typing import List, Set, Dict, Tuple, Optional, Union, Iterable, Any
-
-
-def unambiguous_dna_letters() -> str:
-    """Uppercase IUPAC unambiguous DNA (letters GATC only)."""
-    return "GATC"
-
-
-def ambiguous_dna_letters() -> str:
-    """Uppercase IUPAC ambiguous DNA."""
-    return "GATCRYWSMKHBVDN"
-
-
-def extended_dna_letters() -> str:
-    """Extended IUPAC DNA alphabet.
-    In addition to the standard letter codes GATC, this includes:
-    - ``B`` = 5-bromouridine
-    - ``D`` = 5,6-dihydrouridine
-    - ``S`` = thiouridine
-    - ``W`` = wyosine
-    """
-    return "GATCBDSW"
-
-
-def protein_letters() -> str:
-    """IUPAC protein alphabet of the 20 standard amino acids."""
-    return "ACDEFGHIKLMNPQRSTVWY"
-
-
-def is_valid_dna(sequence: str) -> bool:
-    """Returns `True` if sequence is DNA otherwise `False`"""
-    valid_bases = ["A", "T", "G", "C"]
-    for base in sequence:
-        if base not in valid_bases:
-            return False
-    return True
-
-
-def extended_protein_letters() -> str:
-    """Extended uppercase IUPAC protein single letter alphabet including X etc.
-    In addition to the standard 20 single letter protein codes, this includes:
-    - ``B`` = "Asx";  Aspartic acid (R) or Asparagine (N)
-    - ``X`` = "Xxx";  Unknown or 'other' amino acid
-    - ``Z`` = "Glx";  Glutamic acid (E) or Glutamine (Q)
-    - ``J`` = "Xle";  Leucine (L) or Isoleucine (I), used in mass-spec (NMR)
-    - ``U`` = "Sec";  Selenocysteine
-    - ``O`` = "Pyl";  Pyrrolysine
-    This alphabet is not intended to be used with ``X`` for Selenocysteine
-    (an ad-hoc standard prior to the IUPAC adoption of ``U`` instead).
-    """
-    return "ACDEFGHIKLMNPQRSTVWYBXZJUO"
-
-
-def reverse(sequence: str) -> str:
-    """Returns a reversed string."""
-    return sequence[::-1]
-
-
-def complement(sequence: str) -> str:
-    """Returns a complement of a DNA sequence."""
-    complement_dict = {"A": "T", "C": "G", "T": "A", "G": "C"}
-    sequences = list(sequence)
-    sequences = [complement_dict[base] for base in sequences]
-    return "".join(sequences)
-
-
-def reverse_complement(sequence: str) -> str:
-    """"Returns a reverse complement of a DNA sequence."""
-    sequence = reverse(sequence)
-    sequence = complement(sequence)
-    return sequence
-
-
-def gc_content(sequence: str) -> float:
-    """Returns percent of 'Gs' and 'Cs' in the nucleotide sequence."""
-    sequence = sequence.upper()
-    gc_count = sequence.count("G") + sequence.count("C")
-    gc_fraction = float(gc_count) / len(sequence)
-    return 100 * gc_fraction
-
-
-def restriction_enzymes() -> List[str]:
-    import os
-    from pathlib import Path
-
-    re_file = os.path.join(
-        Path(os.path.abspath(__file__)).parent, "restriction_enzymes.txt"
-    )
-    if not os.path.exists(re_file):
-        msg = "You must include the file containing restriction enzymes"
-        raise ValueError(msg)
-
-    with open(re_file, "r") as fh:
-        restriction_enzymes = [re_.strip() for re_ in fh.readlines()]
-    return restriction_enzymes
-
-
-# aka: parse_fasta_file
-# aka: format_sequence_dictionary
-def fasta_to_dictionary(f: str) -> List[Dict[str, str]]:
-    """Converts a file containing sequence(s) in FASTA format into a list of dictionary.
-    Eg: 
-    - ">desc\nAGTAGTAGGATAA\n"  => [{'id': 'desc'; 'sequence': 'AGTAGTAGGATAA'}]
-    - ">desc1\nAGTAGTAGGATAA\n>desc2\nAACGTAGTGGCAG\n" => [{'id': 'desc1'; 'sequence': 'AGTAGTAGGATAA}, {'id': 'desc2'; 'sequence': 'AACGTAGTGGCAG'}]
-    """
-
-    from pathlib import Path
-
-    if not Path(f).is_file():
-        print(f"File {f} does not exist.")
-
-    sequences = []
-    try:
-        with open(f, "r") as fh:
-            sequence_text = fh.read()
-
-        if ">" in sequence_text:
-            input_sequences = sequence_text.split(">")
-            for i in input_sequences[1:]:
-
-                if len(i) > 0:
-                    description = i.split("\n")[0]
-                    end_of_description = i.find("\n")
-
-                sequence = i[end_of_description:].split()
-                sequences.append({"id": description, "sequence": "".join(sequence)})
-        else:
-            sequences.append(
-                {"id": "unknown_id", "sequence": "".join(sequence_text.split("\n"))}
-            )
-    except:
-        raise IOError(f"Input file '{f}' is not accessible.")
-
-    return sequences
-
-
-def write_to_file(
-    data: List[Dict[Any, Any]], filename: str, format: str = "fasta"
-) -> None:
-    """Writes the content of the `data` into a file of specific `format`"""
-    from collections import abc
-
-    if not data:
-        raise ValueError("Requires a content/data to write to the file.")
-
-    if not filename:
-        raise ValueError("'filename' is required.")
-
-    try:
-        if isinstance(data, abc.Sequence):
-            with open(filename, "w") as fh:
-                for record_ in data:
-                    dictionary_ = isinstance(record_, abc.Mapping)
-                    if dictionary_:
-                        header_ = record_["id"]
-                        sequence_ = record_["sequence"]
-                        if format == "fasta":
-                            fh.write(f">{header_}\n{sequence_}\n")
-                        else:
-                            raise ValueError(f"{format} format is not available yet.")
-                    else:
-                        raise ValueError("dictionary-like object required!")
-    except:
-        msg = "Only input 'data' must be a list of dictionary-like object."
-        raise TypeError(msg)
-
-
-def generate_hash(input_: str) -> str:
-    """Generates hash value for an input string."""
-
-    import hashlib
-
-    hash_map = {}
-
-    hash_id = hashlib.sha224(input_.encode("utf-8")).hexdigest()
-    hash_map[hash_id] = input_
-    return hash_id
-
-
-def generate_sequence_info(sequence: str, description: str = None) -> dict:
-    """Converts a raw sequence into a dictionary
-    containing randomly generate sequence_id, hash_id and description.
-    """
-
-    import random
-    import string
-
-    # NOTE: generate a random alphanumeric string of length 32 as `sequence id`
-    sequence_id = "".join(
-        [random.choice(string.ascii_letters + string.digits) for n in range(32)]
-    )
-
-    # NOTE: `description` is set to None by default
-    # TODO: fasta header would replace the None value?
-    description = None
-    sequence = "".join(sequence.split())
-
-    hash_id = generate_hash(sequence_id)
-
-    # TODO: write a simple validation for
-    # Protein - check against valid amino acid residues
-    # DNA - check agains ATGC
-    # `sequence_id` doesn't seem to be important here...
-    # print(f"TODO: misssing validation for: {sequence_id}")
-
-    data = {
-        "hash_id": hash_id,
-        "sequence_id": sequence_id,
-        "description": description,
-        "sequence": sequence,
-    }
-    return data
+"""Commonly used Bio related functions. 
+
+"""
+
+import functools
+import hashlib
+import mmap
+import os
+import random
+import string
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import List, Set, Dict, Tuple, Optional, Union, Iterable, Any, Final
+
+# NOTE: alphabet for random sequence ids, built once at import time.
+_ALPHANUMERIC = string.ascii_letters + string.digits
+
+# NOTE: the IUPAC alphabets as module-level constants; the *_letters
+# functions below remain as thin wrappers for API compatibility.
+UNAMBIGUOUS_DNA: Final[str] = "GATC"
+AMBIGUOUS_DNA: Final[str] = "GATCRYWSMKHBVDN"
+EXTENDED_DNA: Final[str] = "GATCBDSW"
+PROTEIN: Final[str] = "ACDEFGHIKLMNPQRSTVWY"
+EXTENDED_PROTEIN: Final[str] = "ACDEFGHIKLMNPQRSTVWYBXZJUO"
+
+# NOTE: precomputed translation table so `complement` runs as a single
+# C-level pass instead of a per-base dictionary lookup. Covers the full
+# IUPAC ambiguity alphabet (see `ambiguous_dna_letters`), not just ACGT.
+_COMPLEMENT_TABLE = str.maketrans(
+    "ACGTRYSWKMBDHVNacgtryswkmbdhvn", "TGCAYRSWMKVHDBNtgcayrswmkvhdbn"
+)
+_COMPLEMENT_BYTES_TABLE = bytes.maketrans(
+    b"ACGTRYSWKMBDHVNacgtryswkmbdhvn", b"TGCAYRSWMKVHDBNtgcayrswmkvhdbn"
+)
+
+# NOTE: sequences longer than this take the byte-level fast paths
+# (vectorized NumPy table gather, bytearray reversal).
+_LARGE_SEQUENCE_THRESHOLD = 65536
+
+# NOTE: deletes the valid DNA letters; a sequence is valid DNA iff
+# nothing survives the translation.
+_DNA_DELETE_TABLE = str.maketrans("", "", "ACGT")
+
+# NOTE: deletes G/C in either case, so GC counting needs neither an
+# uppercased copy nor two separate `count` scans.
+_GC_DELETE_TABLE = str.maketrans("", "", "GCgc")
+
+# NOTE: strips all ASCII whitespace in one C-level pass, avoiding the
+# intermediate list that `"".join(s.split())` builds.
+_WHITESPACE_DELETE_TABLE = str.maketrans("", "", " \t\n\r\x0b\x0c")
+
+
+def _gc_content_numpy(sequence: str) -> float:
+    """Computes percent GC via vectorized NumPy byte comparisons."""
+    import numpy as np
+
+    a = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    gc_count = ((a == 0x47) | (a == 0x43) | (a == 0x67) | (a == 0x63)).sum()
+    return 100.0 * float(gc_count) / a.size
+
+
+def _complement_numpy(sequence: str, reverse: bool = False) -> str:
+    """Complements `sequence` via a vectorized NumPy table lookup."""
+    import numpy as np
+
+    lut = np.frombuffer(_COMPLEMENT_BYTES_TABLE, dtype=np.uint8)
+    a = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    a = lut[a][::-1] if reverse else lut[a]
+    return a.tobytes().decode("ascii")
+
+
+def pack_dna(sequence: str) -> bytes:
+    """Packs an ACGT sequence into 2 bits per base (A=0, C=1, G=2, T=3).
+
+    Four bases per byte, least-significant pair first; the tail byte is
+    zero-padded, so callers need the original length to unpack (see
+    `unpack_dna`). Requires NumPy.
+    """
+    import numpy as np
+
+    lut = np.full(256, 255, dtype=np.uint8)
+    lut[np.frombuffer(b"ACGT", dtype=np.uint8)] = np.arange(4, dtype=np.uint8)
+    a = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    codes = lut[a]
+    if codes.size and codes.max() > 3:
+        raise ValueError("pack_dna requires an unambiguous ACGT sequence.")
+
+    padding = -codes.size % 4
+    if padding:
+        codes = np.concatenate([codes, np.zeros(padding, dtype=np.uint8)])
+    weights = np.array([1, 4, 16, 64], dtype=np.uint8)
+    return (codes.reshape(-1, 4) * weights).sum(axis=1).astype(np.uint8).tobytes()
+
+
+def _unpack_codes(packed: bytes, length: int):
+    """Expands a 2-bit packed buffer back into an array of base codes."""
+    import numpy as np
+
+    a = np.frombuffer(packed, dtype=np.uint8)
+    shifts = np.array([0, 2, 4, 6], dtype=np.uint8)
+    return ((a[:, None] >> shifts) & 3).reshape(-1)[:length]
+
+
+def unpack_dna(packed: bytes, length: int) -> str:
+    """Unpacks a `pack_dna` buffer back into an ACGT string of `length` bases."""
+    import numpy as np
+
+    bases = np.frombuffer(b"ACGT", dtype=np.uint8)
+    return bases[_unpack_codes(packed, length)].tobytes().decode("ascii")
+
+
+def complement_packed(packed: bytes) -> bytes:
+    """Complements a 2-bit packed buffer in one vectorized XOR.
+
+    In the 2-bit encoding the complement of every base code ``c`` is
+    ``3 - c``, so the whole buffer complements as ``packed ^ 0xFF``.
+    """
+    import numpy as np
+
+    return (np.frombuffer(packed, dtype=np.uint8) ^ 0xFF).tobytes()
+
+
+def reverse_complement_packed(packed: bytes, length: int) -> bytes:
+    """Returns the reverse complement of a 2-bit packed buffer, repacked."""
+    import numpy as np
+
+    codes = (3 - _unpack_codes(packed, length))[::-1]
+    padding = -codes.size % 4
+    if padding:
+        codes = np.concatenate([codes, np.zeros(padding, dtype=np.uint8)])
+    weights = np.array([1, 4, 16, 64], dtype=np.uint8)
+    return (codes.reshape(-1, 4) * weights).sum(axis=1).astype(np.uint8).tobytes()
+
+
+def unambiguous_dna_letters() -> str:
+    """Uppercase IUPAC unambiguous DNA (letters GATC only)."""
+    return UNAMBIGUOUS_DNA
+
+
+def ambiguous_dna_letters() -> str:
+    """Uppercase IUPAC ambiguous DNA."""
+    return AMBIGUOUS_DNA
+
+
+def extended_dna_letters() -> str:
+    """Extended IUPAC DNA alphabet.
+    In addition to the standard letter codes GATC, this includes:
+    - ``B`` = 5-bromouridine
+    - ``D`` = 5,6-dihydrouridine
+    - ``S`` = thiouridine
+    - ``W`` = wyosine
+    """
+    return EXTENDED_DNA
+
+
+def protein_letters() -> str:
+    """IUPAC protein alphabet of the 20 standard amino acids."""
+    return PROTEIN
+
+
+def is_valid_dna(sequence: str) -> bool:
+    """Returns `True` if sequence is DNA otherwise `False`"""
+    return not sequence.translate(_DNA_DELETE_TABLE)
+
+
+def extended_protein_letters() -> str:
+    """Extended uppercase IUPAC protein single letter alphabet including X etc.
+    In addition to the standard 20 single letter protein codes, this includes:
+    - ``B`` = "Asx";  Aspartic acid (R) or Asparagine (N)
+    - ``X`` = "Xxx";  Unknown or 'other' amino acid
+    - ``Z`` = "Glx";  Glutamic acid (E) or Glutamine (Q)
+    - ``J`` = "Xle";  Leucine (L) or Isoleucine (I), used in mass-spec (NMR)
+    - ``U`` = "Sec";  Selenocysteine
+    - ``O`` = "Pyl";  Pyrrolysine
+    This alphabet is not intended to be used with ``X`` for Selenocysteine
+    (an ad-hoc standard prior to the IUPAC adoption of ``U`` instead).
+    """
+    return EXTENDED_PROTEIN
+
+
+def _reverse_bytes(sequence: str) -> str:
+    """Reverses an ASCII sequence in place through a bytearray."""
+    ba = bytearray(sequence, "ascii")
+    ba.reverse()
+    return ba.decode("ascii")
+
+
+def reverse(sequence: str) -> str:
+    """Returns a reversed string."""
+    if len(sequence) > _LARGE_SEQUENCE_THRESHOLD:
+        try:
+            return _reverse_bytes(sequence)
+        except UnicodeEncodeError:
+            pass
+    return sequence[::-1]
+
+
+def complement(sequence: str) -> str:
+    """Returns a complement of a DNA sequence."""
+    if len(sequence) > _LARGE_SEQUENCE_THRESHOLD:
+        try:
+            return _complement_numpy(sequence)
+        except (ImportError, UnicodeEncodeError):
+            pass
+    return sequence.translate(_COMPLEMENT_TABLE)
+
+
+def reverse_complement(sequence: str) -> str:
+    """Returns a reverse complement of a DNA sequence."""
+    if len(sequence) > _LARGE_SEQUENCE_THRESHOLD:
+        try:
+            return _complement_numpy(sequence, reverse=True)
+        except (ImportError, UnicodeEncodeError):
+            pass
+    return sequence.translate(_COMPLEMENT_TABLE)[::-1]
+
+
+def gc_content(sequence: str) -> float:
+    """Returns percent of 'Gs' and 'Cs' in the nucleotide sequence."""
+    if len(sequence) > _LARGE_SEQUENCE_THRESHOLD:
+        try:
+            return _gc_content_numpy(sequence)
+        except (ImportError, UnicodeEncodeError):
+            pass
+    gc_count = len(sequence) - len(sequence.translate(_GC_DELETE_TABLE))
+    gc_fraction = float(gc_count) / len(sequence)
+    return 100 * gc_fraction
+
+
+def gc_content_batch(sequences: Iterable[str]) -> List[float]:
+    """Returns percent GC for each sequence in a batch."""
+    return [gc_content(sequence) for sequence in sequences]
+
+
+# NOTE: the enzyme file is immutable for the process lifetime, so the
+# parsed list is cached after the first call.
+@functools.lru_cache(maxsize=1)
+def restriction_enzymes() -> List[str]:
+    re_file = Path(__file__).parent / "restriction_enzymes.txt"
+    if not re_file.exists():
+        msg = "You must include the file containing restriction enzymes"
+        raise ValueError(msg)
+
+    return [re_.strip() for re_ in re_file.read_text().splitlines()]
+
+
+# aka: parse_fasta_file
+# aka: format_sequence_dictionary
+def fasta_to_dictionary(f: str) -> List[Dict[str, str]]:
+    """Converts a file containing sequence(s) in FASTA format into a list of dictionary.
+    Eg: 
+    - ">desc\nAGTAGTAGGATAA\n"  => [{'id': 'desc'; 'sequence': 'AGTAGTAGGATAA'}]
+    - ">desc1\nAGTAGTAGGATAA\n>desc2\nAACGTAGTGGCAG\n" => [{'id': 'desc1'; 'sequence': 'AGTAGTAGGATAA}, {'id': 'desc2'; 'sequence': 'AACGTAGTGGCAG'}]
+    """
+
+    if not Path(f).is_file():
+        print(f"File {f} does not exist.")
+
+    sequences = []
+    try:
+        fh = open(f, "r", buffering=1 << 20)
+    except OSError:
+        raise IOError(f"Input file '{f}' is not accessible.")
+
+    # NOTE: single streaming pass with a large read buffer; sequence
+    # lines are only joined at record boundaries, so peak memory stays
+    # proportional to the largest record instead of the whole file.
+    current_id = None
+    current_sequence = []
+    with fh:
+        for line in fh:
+            if line.startswith(">"):
+                if current_id is not None:
+                    sequences.append(
+                        {"id": current_id, "sequence": "".join(current_sequence)}
+                    )
+                # NOTE: also discards any content before the first header.
+                current_sequence = []
+                current_id = line[1:].rstrip()
+            else:
+                current_sequence.append(line.rstrip())
+        if current_id is not None:
+            sequences.append(
+                {"id": current_id, "sequence": "".join(current_sequence)}
+            )
+        elif current_sequence:
+            sequences.append(
+                {"id": "unknown_id", "sequence": "".join(current_sequence)}
+            )
+
+    return sequences
+
+
+def _parse_fasta_range(f: str, start: int, end: int) -> List[Dict[str, str]]:
+    """Parses the FASTA records in the byte range [start, end) of a file."""
+    with open(f, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            chunk = mm[start:end]
+        finally:
+            mm.close()
+
+    sequences = []
+    current_id = None
+    current_sequence = []
+    for line in chunk.splitlines():
+        if line.startswith(b">"):
+            if current_id is not None:
+                sequences.append(
+                    {
+                        "id": current_id,
+                        "sequence": b"".join(current_sequence).decode("ascii"),
+                    }
+                )
+            # NOTE: also discards any content before the first header.
+            current_sequence = []
+            current_id = line[1:].rstrip().decode("ascii")
+        else:
+            current_sequence.append(line.rstrip())
+    # NOTE: a headerless file never reaches workers (no "\n>" to split
+    # on means the caller falls back to the serial parser), so a chunk
+    # holding only pre-header bytes contributes nothing.
+    if current_id is not None:
+        sequences.append(
+            {"id": current_id, "sequence": b"".join(current_sequence).decode("ascii")}
+        )
+    return sequences
+
+
+def fasta_to_dictionary_parallel(
+    f: str, workers: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """Parses a FASTA file in parallel over record-aligned byte ranges.
+
+    The file is split into roughly equal chunks aligned to record
+    boundaries; each worker process mmaps the file and parses only its
+    own range, so no sequence data crosses process boundaries on the way
+    in. Falls back to `fasta_to_dictionary` for a single worker.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return fasta_to_dictionary(f)
+
+    try:
+        size = os.path.getsize(f)
+    except OSError:
+        raise IOError(f"Input file '{f}' is not accessible.")
+
+    # NOTE: mmap rejects zero-length files; defer to the serial parser.
+    if size == 0:
+        return fasta_to_dictionary(f)
+
+    # NOTE: align chunk starts to the next "\n>" so every range holds
+    # whole records; duplicates collapse when the file has fewer records
+    # than workers.
+    with open(f, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            step = size // workers
+            starts = [0]
+            for i in range(1, workers):
+                pos = mm.find(b"\n>", i * step)
+                if pos != -1:
+                    starts.append(pos + 1)
+        finally:
+            mm.close()
+
+    starts = sorted(set(starts))
+    ends = starts[1:] + [size]
+    if len(starts) == 1:
+        return fasta_to_dictionary(f)
+
+    sequences = []
+    with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+        for chunk_records in executor.map(
+            _parse_fasta_range, [f] * len(starts), starts, ends
+        ):
+            sequences.extend(chunk_records)
+    return sequences
+
+
+class FastaIndex:
+    """Random access to FASTA records backed by a memory-mapped file.
+
+    Builds a faidx-style offset table in one scan; sequences are only
+    materialized on request, so resident memory stays at index size
+    rather than file size. Eg:
+
+    >>> index = fasta_index("sequences.fa")
+    >>> index.ids()[0]
+    'desc'
+    >>> index.get_sequence(0)
+    'AGTAGTAGGATAA'
+    """
+
+    def __init__(self, f: str) -> None:
+        self._fh = open(f, "rb")
+        self._records = []
+
+        # NOTE: mmap rejects zero-length files; an empty file is simply
+        # an empty index.
+        if os.fstat(self._fh.fileno()).st_size == 0:
+            self._mm = None
+            return
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # NOTE: mm.find runs at memchr speed, so the whole scan touches
+        # each byte once without any Python-level iteration.
+        mm = self._mm
+        pos = mm.find(b">")
+        while pos != -1:
+            header_end = mm.find(b"\n", pos)
+            if header_end == -1:
+                break
+            next_record = mm.find(b"\n>", header_end)
+            seq_end = len(mm) if next_record == -1 else next_record
+            record_id = mm[pos + 1 : header_end].rstrip().decode("ascii")
+            self._records.append((record_id, header_end + 1, seq_end))
+            pos = -1 if next_record == -1 else next_record + 1
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def ids(self) -> List[str]:
+        """Returns the record ids in file order."""
+        return [record_id for record_id, _, _ in self._records]
+
+    def get_sequence(self, i: int) -> str:
+        """Returns the i-th sequence, newlines stripped."""
+        _, start, end = self._records[i]
+        return self._mm[start:end].translate(None, delete=b"\r\n").decode("ascii")
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._fh.close()
+
+
+def fasta_index(f: str) -> FastaIndex:
+    """Builds a :class:`FastaIndex` over a FASTA file for random access
+    without loading the sequences into memory.
+    """
+    if not Path(f).is_file():
+        raise IOError(f"Input file '{f}' is not accessible.")
+    return FastaIndex(f)
+
+
+def write_to_file(
+    data: List[Dict[Any, Any]], filename: str, format: str = "fasta"
+) -> None:
+    """Writes the content of the `data` into a file of specific `format`"""
+    if not data:
+        raise ValueError("Requires a content/data to write to the file.")
+
+    if not filename:
+        raise ValueError("'filename' is required.")
+
+    if format != "fasta":
+        raise ValueError(f"{format} format is not available yet.")
+
+    # NOTE: validate upfront so the write loop runs without any per-record
+    # isinstance checks or a try/except around the hot path.
+    if not isinstance(data, Sequence) or not all(
+        isinstance(record_, Mapping) for record_ in data
+    ):
+        msg = "Only input 'data' must be a list of dictionary-like object."
+        raise TypeError(msg)
+
+    # NOTE: writelines over a generator amortizes the per-record call
+    # overhead; the 1 MB buffer batches the actual writes.
+    lines = (f">{record_['id']}\n{record_['sequence']}\n" for record_ in data)
+    with open(filename, "w", buffering=1 << 20) as fh:
+        fh.writelines(lines)
+
+
+def generate_hash(input_: str, algo: str = "blake2b") -> str:
+    """Generates hash value for an input string.
+
+    Uses ``blake2b`` (28-byte digest, same hex length as SHA-224) by
+    default for its lower per-call overhead; pass ``algo="sha224"`` for
+    the previous behaviour.
+    """
+    if algo == "blake2b":
+        return hashlib.blake2b(input_.encode("utf-8"), digest_size=28).hexdigest()
+    return hashlib.new(algo, input_.encode("utf-8")).hexdigest()
+
+
+def generate_hashes(inputs: Iterable[str]) -> List[str]:
+    """Generates hash values for a batch of input strings."""
+    # NOTE: copying one prototype object skips the constructor (and its
+    # parameter validation) on every message.
+    prototype = hashlib.blake2b(digest_size=28)
+    hash_ids = []
+    for input_ in inputs:
+        h = prototype.copy()
+        h.update(input_.encode("utf-8"))
+        hash_ids.append(h.hexdigest())
+    return hash_ids
+
+
+def generate_sequence_info(sequence: str, description: str = None) -> dict:
+    """Converts a raw sequence into a dictionary
+    containing randomly generate sequence_id, hash_id and description.
+    """
+
+    # NOTE: generate a random alphanumeric string of length 32 as `sequence id`
+    sequence_id = "".join(random.choices(_ALPHANUMERIC, k=32))
+
+    sequence = sequence.translate(_WHITESPACE_DELETE_TABLE)
+
+    hash_id = generate_hash(sequence_id)
+
+    # TODO: write a simple validation for
+    # Protein - check against valid amino acid residues
+    # DNA - check agains ATGC
+    # `sequence_id` doesn't seem to be important here...
+    # print(f"TODO: misssing validation for: {sequence_id}")
+
+    data = {
+        "hash_id": hash_id,
+        "sequence_id": sequence_id,
+        "description": description,
+        "sequence": sequence,
+    }
+    return data
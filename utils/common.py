@@ -1,5 +1,6 @@
 """Functions for all common tasks.
 """
+import functools
 import os
 import sys
 import time
@@ -11,10 +12,16 @@ from typing import List, Set, Dict, Tuple, Optional, Union, Iterable
 def speed_test(func):
     """Decorator that prints to STDIO the total time taken for a method execution"""
 
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        t1 = time.time()
-        func(*args, **kwargs)
-        print(f"'{func.__name__}' took {time.time() - t1} sec.")
+        t1 = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = (time.perf_counter_ns() - t1) / 1e9
+            print(f"'{func.__name__}' took {elapsed:.6f} sec.")
+
+    return wrapper
 
 
 def compress_file(file_: str) -> None:
@@ -31,23 +38,27 @@ def compress_file(file_: str) -> None:
         print(f"{file_} has been gzipped.")
 
 
-def filename_by_extension(input_: str, extension: str) -> List[str]:
-    """Returns a list of file(s) with the matching extension"""
-    files = []
+def iter_filenames_by_extension(input_: str, extension: str) -> Iterable[str]:
+    """Yields file(s) with the matching extension, lazily."""
+    suffix = "." + extension.lstrip(".")
     if os.path.isdir(input_):
-        files.extend(
-            [
-                os.path.join(input_, file_)
-                for file_ in os.listdir(input_)
-                if file_.endswith(extension)
-            ]
-        )
+        # NOTE: scandir iterates lazily and caches the file-type check,
+        # so large directories are not materialized up front.
+        with os.scandir(input_) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    yield os.path.join(input_, entry.name)
     elif os.path.isfile(input_):
-        if input_.endswith(extension):
-            files.append(input_)
+        if input_.endswith(suffix):
+            yield input_
     else:
         raise ValueError(f"No such input found: {input_}")
 
+
+def filename_by_extension(input_: str, extension: str) -> List[str]:
+    """Returns a list of file(s) with the matching extension"""
+    files = list(iter_filenames_by_extension(input_, extension))
+
     if not files:
         msg = f"Input must be either a '{extension}'' file or a directory containing multiple '{extension}' files."
         raise FileNotFoundError(msg)
@@ -55,6 +66,12 @@ def filename_by_extension(input_: str, extension: str) -> List[str]:
     return files
 
 
-def extract_filename(path: str) -> Tuple[str, str]:
+def extract_filename(path: Union[str, os.PathLike]) -> Tuple[str, str]:
     """Returns the file name from the file path"""
-    return os.path.splitext(os.path.split(path)[1])
+    return os.path.splitext(os.path.basename(os.fspath(path)))
+
+
+def extract_filenames(paths: Iterable[Union[str, os.PathLike]]) -> Iterable[Tuple[str, str]]:
+    """Yields the file name for each file path, lazily."""
+    for path in paths:
+        yield extract_filename(path)